@@ -144,9 +144,9 @@ class Edges(Vertices):
         if es is not None:
             utils.arr.is_shape(es, (-1, 2), strict=True)
 
-        # same, but non-writeable view of tracked array
+        # same, but non-writeable view of tracked array.
+        # TrackedArray.view() sets writeable flag
         self._const_edges = self._edges.view()
-        self._const_edges.flags.writeable = False
 
     @property
     def const_edges(self):
@@ -364,6 +364,25 @@ class Edges(Vertices):
         """Alias to update_elements."""
         return self.update_elements(*args, **kwargs)
 
+    def copy(self):
+        """Returns copy of self. Copies elements, if they are set, on top of
+        `Vertices.copy()`.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        self_copy: type(self)
+        """
+        copied = super().copy()
+        # elements may not be set
+        if hasattr(self, "_" + type(self).__qualname__.lower()):
+            copied.elements = self.const_elements.copy()
+
+        return copied
+
     def dashed(self, spacing=None):
         """Turn edges into dashed edges(=lines). Given spacing, it will try to
         chop edges as close to it as possible. Pattern should look:
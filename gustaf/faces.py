@@ -1,5 +1,7 @@
 """gustaf/gustaf/faces.py."""
 
+import copy
+
 import numpy as np
 
 from gustaf import helpers, settings, show, utils
@@ -217,9 +219,9 @@ class Faces(Edges):
                 strict=True,
             )
 
-        # same, but non-writeable view of tracked array
+        # same, but non-writeable view of tracked array.
+        # TrackedArray.view() sets writeable flag
         self._const_faces = self._faces.view()
-        self._const_faces.flags.writeable = False
 
     @property
     def const_faces(self):
@@ -295,6 +297,22 @@ class Faces(Edges):
         """Alias to update_elements."""
         self.update_elements(*args, **kwargs)
 
+    def copy(self):
+        """Returns copy of self. Copies BC on top of `Edges.copy()`.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        self_copy: type(self)
+        """
+        copied = super().copy()
+        copied.BC = copy.deepcopy(self.BC)
+
+        return copied
+
     def to_edges(self, unique=True):
         """Returns Edges obj.
 
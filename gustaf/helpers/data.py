@@ -69,6 +69,14 @@ class TrackedArray(np.ndarray):
         else:
             self._modified = m
 
+    def mark_dirty(self):
+        """Marks array as modified. Inplace changes through this array are
+        tracked, but writes that bypass it, for example through
+        `np.asarray(arr)` or ufunc's `out=`, are not. Call this after such
+        writes to invalidate values computed from this array.
+        """
+        self.modified = True
+
     def copy(self, *args, **kwargs):
         """copy creates regular numpy array"""
         return np.array(self, *args, copy=True, **kwargs)
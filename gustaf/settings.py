@@ -5,6 +5,8 @@ Global variables/constants that's used throughout `gustaf`.
 
 TOLERANCE = 1e-10
 
+# "float32" halves the memory of vertices and traffic of their traversals.
+# In that case, TOLERANCE should be set to >= 1e-6.
 FLOAT_DTYPE = "float64"
 INT_DTYPE = "int32"
 
@@ -19,3 +21,6 @@ VEDO_DEFAULT_OPTIONS = {
 }
 
 NTHREADS = 1
+
+# use numba-jitted kernels, if numba is available
+NUMBA_ACCEL = False
@@ -52,12 +52,13 @@ sys.modules[__name__].__class__ = _CallableShowDotPy
 
 
 # True if the current environment is IPython else False.
-try:
+# IPython is always imported in IPython environments, so we don't have to pay
+# for its import otherwise.
+is_ipython = False
+if "IPython" in sys.modules:
     from IPython import get_ipython
 
     is_ipython = get_ipython() is not None
-except ImportError:
-    is_ipython = False
 
 
 def show(*args, **kwargs):
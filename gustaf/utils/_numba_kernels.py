@@ -0,0 +1,310 @@
+"""gustaf/gustaf/utils/_numba_kernels.py.
+
+numba jitted kernels for `gustaf.utils.arr`. Importing numba is expensive,
+so this module is only imported once a kernel is requested. See
+`settings.NUMBA_ACCEL`.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def _splitmix64(x):
+    """splitmix64 finalizer. Scrambles bits of an uint64."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@numba.njit(cache=True)
+def _hash_lanes(lanes):
+    """Mixes quantized coordinates (=lanes) of a row into one int64."""
+    h = np.uint64(0)
+    for lane in lanes:
+        h = _splitmix64(h ^ np.uint64(lane))
+    return np.int64(h)
+
+
+@numba.njit(cache=True)
+def _cell_key(cell, origin, packed):
+    """Hash key of a cell. If packed, each lane relative to origin fits in
+    21 bits, so all the lanes are packed into one uint64 and scrambled once.
+    As splitmix64 is a bijection, packed keys are unique per cell.
+    """
+    if not packed:
+        return _hash_lanes(cell)
+
+    word = np.uint64(0)
+    for j in range(len(cell)):
+        word |= np.uint64(cell[j] - origin[j]) << np.uint64(21 * j)
+    return np.int64(_splitmix64(word))
+
+
+@numba.njit(cache=True)
+def _find_bucket(table_keys, table_ids, key):
+    """Open addressing lookup. Returns -1 if key does not exist."""
+    mask = len(table_ids) - 1
+    slot = key & mask
+    while table_ids[slot] != -1:
+        if table_keys[slot] == key:
+            return table_ids[slot]
+        slot = (slot + 1) & mask
+    return -1
+
+
+@numba.njit(cache=True)
+def _visit_neighbors(  # noqa: PLR0917
+    i,
+    arr,
+    quantized,
+    sides,
+    origin,
+    packed,
+    table_keys,
+    table_ids,
+    bucket_bounds,
+    order,
+    tol_sq,
+    neighbors,
+    fill,
+):
+    """Loops over rows in the neighboring cells of i-th row and counts
+    the ones within the tolerance. If fill, writes their ids into
+    neighbors.
+    """
+    d = arr.shape[1]
+    cell = np.empty(d, dtype=np.int64)
+    smallest = i
+    count = 0
+    for k in range(2**d):
+        for j in range(d):
+            cell[j] = quantized[i, j]
+            if (k >> j) & 1:
+                cell[j] += sides[i, j]
+        key = _cell_key(cell, origin, packed)
+        b = _find_bucket(table_keys, table_ids, key)
+        if b < 0:
+            continue
+
+        for s in range(bucket_bounds[b], bucket_bounds[b + 1]):
+            other = order[s]
+            # hash collisions are possible, unless packed. compare cells
+            if not packed:
+                same_cell = True
+                for j in range(d):
+                    if quantized[other, j] != cell[j]:
+                        same_cell = False
+                        break
+                if not same_cell:
+                    continue
+
+            dist_sq = 0.0
+            for j in range(d):
+                diff = arr[i, j] - arr[other, j]
+                dist_sq += diff * diff
+            if dist_sq <= tol_sq:
+                if fill:
+                    neighbors[count] = other
+                count += 1
+                smallest = min(smallest, other)
+
+    return smallest, count
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def close_rows(arr, tolerance, return_intersection):
+    """Spatial hashing based radius search. Each row is quantized into a
+    cell of size `2 * tolerance` and hashed. Rows within the tolerance
+    can then only be found in the same cell or in the directly
+    neighboring cells towards the closer half of the cell, which makes
+    2^d cells to visit per row. For up to 3D, if quantized coordinates
+    span less than 21 bits per axis, they are packed into a single word
+    before hashing.
+
+    Parameters
+    -----------
+    arr: (n, d) np.ndarray
+    tolerance: float
+    return_intersection: bool
+
+    Returns
+    --------
+    o_inverse: (n,) np.ndarray
+      smallest id of neighbors, including itself.
+    n_neighbors: (n,) np.ndarray
+    neighbors: (n_neighbors.sum(),) np.ndarray
+      sorted neighbor ids of each row, flattened. Empty if
+      return_intersection is False.
+    """
+    n, d = arr.shape
+
+    # quantize and hash
+    cell_size = 2.0 * tolerance
+    quantized = np.empty((n, d), dtype=np.int64)
+    sides = np.empty((n, d), dtype=np.int64)
+    keys = np.empty(n, dtype=np.int64)
+    for i in numba.prange(n):
+        for j in range(d):
+            scaled = arr[i, j] / cell_size
+            q = np.floor(scaled)
+            quantized[i, j] = np.int64(q)
+            sides[i, j] = 1 if scaled - q >= 0.5 else -1
+
+    # if cells, including the neighboring ones, span less than 21 bits per
+    # axis, keys can be packed into one word
+    origin = np.empty(d, dtype=np.int64)
+    packed = n > 0 and d <= 3
+    for j in range(d):
+        if not packed:
+            break
+        q_min = quantized[0, j]
+        q_max = quantized[0, j]
+        for i in range(1, n):
+            q_min = min(q_min, quantized[i, j])
+            q_max = max(q_max, quantized[i, j])
+        origin[j] = q_min - 1
+        packed = q_max - q_min + 2 < 2**21
+
+    for i in numba.prange(n):
+        keys[i] = _cell_key(quantized[i], origin, packed)
+
+    # group rows with the same key into buckets
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    is_start = np.ones(n, dtype=np.bool_)
+    for i in numba.prange(1, n):
+        is_start[i] = sorted_keys[i] != sorted_keys[i - 1]
+    starts = np.flatnonzero(is_start)
+    bucket_bounds = np.empty(len(starts) + 1, dtype=np.int64)
+    bucket_bounds[:-1] = starts
+    bucket_bounds[-1] = n
+
+    # key -> bucket id table. Keys are already scrambled, so the lower
+    # bits can be directly used as slot.
+    table_size = 2
+    while table_size < 2 * len(starts):
+        table_size *= 2
+    table_keys = np.empty(table_size, dtype=np.int64)
+    table_ids = np.full(table_size, -1, dtype=np.int64)
+    for b in range(len(starts)):
+        key = sorted_keys[starts[b]]
+        slot = key & (table_size - 1)
+        while table_ids[slot] != -1:
+            slot = (slot + 1) & (table_size - 1)
+        table_keys[slot] = key
+        table_ids[slot] = b
+
+    tol_sq = tolerance * tolerance
+    o_inverse = np.empty(n, dtype=np.int64)
+    n_neighbors = np.empty(n, dtype=np.int64)
+    no_fill = np.empty(0, dtype=np.int64)
+    for i in numba.prange(n):
+        o_inverse[i], n_neighbors[i] = _visit_neighbors(
+            i,
+            arr,
+            quantized,
+            sides,
+            origin,
+            packed,
+            table_keys,
+            table_ids,
+            bucket_bounds,
+            order,
+            tol_sq,
+            no_fill,
+            False,
+        )
+
+    if not return_intersection:
+        return o_inverse, n_neighbors, no_fill
+
+    # second pass to fill neighbors, now that we know the sizes
+    neighbor_bounds = np.zeros(n + 1, dtype=np.int64)
+    neighbor_bounds[1:] = np.cumsum(n_neighbors)
+    neighbors = np.empty(neighbor_bounds[-1], dtype=np.int64)
+    for i in numba.prange(n):
+        current = neighbors[neighbor_bounds[i] : neighbor_bounds[i + 1]]
+        _visit_neighbors(
+            i,
+            arr,
+            quantized,
+            sides,
+            origin,
+            packed,
+            table_keys,
+            table_ids,
+            bucket_bounds,
+            order,
+            tol_sq,
+            current,
+            True,
+        )
+        current.sort()
+
+    return o_inverse, n_neighbors, neighbors
+
+
+@numba.njit(parallel=True, cache=True)
+def bounds(arr, soa, n_chunks):
+    """Min and max of each column in one pass. Each thread reduces its
+    own chunk of rows, then chunks are reduced.
+    """
+    n, d = (arr.shape[1], arr.shape[0]) if soa else arr.shape
+    n_chunks = max(min(n_chunks, n), 1)
+    chunk_size = (n + n_chunks - 1) // n_chunks
+    # drop trailing chunks that would start past the last row
+    n_chunks = (n + chunk_size - 1) // chunk_size
+    partial = np.empty((n_chunks, 2, d), dtype=arr.dtype)
+    for c in numba.prange(n_chunks):
+        start = c * chunk_size
+        end = min(start + chunk_size, n)
+        for j in range(d):
+            partial[c, 0, j] = arr[j, start] if soa else arr[start, j]
+            partial[c, 1, j] = partial[c, 0, j]
+        for i in range(start + 1, end):
+            for j in range(d):
+                value = arr[j, i] if soa else arr[i, j]
+                if value < partial[c, 0, j]:
+                    partial[c, 0, j] = value
+                elif value > partial[c, 1, j]:
+                    partial[c, 1, j] = value
+                elif np.isnan(value):
+                    # nan propagates, as in np.min and np.max
+                    partial[c, 0, j] = value
+                    partial[c, 1, j] = value
+
+    b = partial[0].copy()
+    for c in range(1, n_chunks):
+        for j in range(d):
+            lower = partial[c, 0, j]
+            upper = partial[c, 1, j]
+            if lower < b[0, j] or np.isnan(lower):
+                b[0, j] = lower
+            if upper > b[1, j] or np.isnan(upper):
+                b[1, j] = upper
+
+    return b
+
+
+@numba.njit(parallel=True, cache=True)
+def select_with_ranges(arr, lower, upper, active, soa):
+    """Checks all the ranges of a row at once. Returns selection mask."""
+    n = arr.shape[1] if soa else arr.shape[0]
+    mask = np.empty(n, dtype=np.bool_)
+    for i in numba.prange(n):
+        selected = True
+        for j in range(len(active)):
+            if not active[j]:
+                continue
+            value = arr[j, i] if soa else arr[i, j]
+            if upper[j] > lower[j]:
+                selected = value > lower[j] and value < upper[j]
+            else:
+                selected = value > lower[j] or value < upper[j]
+            if not selected:
+                break
+        mask[i] = selected
+
+    return mask
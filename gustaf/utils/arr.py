@@ -4,6 +4,8 @@ Useful functions for array / point operations. Named `arr`, since
 `array` is python library and it sounds funny.
 """
 
+from importlib.util import find_spec
+
 import numpy as np
 
 from gustaf import settings
@@ -28,6 +30,8 @@ try:
     has_scipy = True
 except ImportError:
     scipy = ModuleImportRaiser("scipy")
+# numba is imported on demand. see _numba_kernels()
+has_numba = find_spec("numba") is not None
 
 
 def make_c_contiguous(array, dtype=None):
@@ -144,12 +148,35 @@ def unique_rows(
     return unique_stuff
 
 
+def _numba_kernels():
+    """Returns numba kernel module. Imports numba on the first call.
+
+    Parameters
+    -----------
+    None
+
+    Returns
+    --------
+    kernels: module
+      gustaf.utils._numba_kernels
+    """
+    from gustaf.utils import _numba_kernels  # noqa: PLC0415
+
+    return _numba_kernels
+
+
 def close_rows(
-    arr, tolerance=None, return_intersection=False, nthreads=None, **_kwargs
+    arr,
+    tolerance=None,
+    return_intersection=False,
+    nthreads=None,
+    soa=False,
+    **_kwargs,
 ):
     """Similar to unique_rows, but if data type is floats, use this one.
     Performs radius search using KDTree. Currently uses
-    `scipy.spatial.cKDTree`.
+    `scipy.spatial.cKDTree`. If `settings.NUMBA_ACCEL` is True and numba is
+    available, uses spatial hashing based search instead.
 
     Parameters
     -----------
@@ -161,7 +188,11 @@ def close_rows(
       points, this will take a lot of memory space.
     nthreads: int
       number of concurrent query. In case of napf, concurrent build as well.
+      In case of numba, number of threads for the whole search.
       Default is taken from settings.NTHREADS
+    soa: bool
+      Default is False. If True, arr is expected to be (d, n) structure of
+      arrays, for example `Vertices.const_vertices_soa`.
 
     Returns
     --------
@@ -177,6 +208,47 @@ def close_rows(
     if nthreads is None:
         nthreads = settings.NTHREADS
 
+    # back to (n, d), as a view
+    if soa:
+        arr = np.asanyarray(arr).T
+
+    # spatial hashing. quantized coordinates should fit in int64
+    if (
+        settings.NUMBA_ACCEL
+        and has_numba
+        and len(arr) > 0
+        and np.abs(arr).max() / tolerance < 2**61
+    ):
+        kernels = _numba_kernels()
+
+        # same as other backends, nthreads decides concurrency
+        default_nthreads = kernels.numba.get_num_threads()
+        kernels.numba.set_num_threads(
+            max(min(nthreads, kernels.numba.config.NUMBA_NUM_THREADS), 1)
+        )
+        try:
+            o_inverse, n_neighbors, neighbors = kernels.close_rows(
+                np.asarray(arr), tolerance, return_intersection
+            )
+        finally:
+            kernels.numba.set_num_threads(default_nthreads)
+
+        (_, uniq_id, inv) = np.unique(
+            o_inverse,
+            return_index=True,
+            return_inverse=True,
+        )
+
+        if return_intersection:
+            neighbors = np.split(neighbors, np.cumsum(n_neighbors)[:-1])
+        else:
+            neighbors = []
+
+        return arr[uniq_id], uniq_id, inv, neighbors
+
+    # only copies if it is a strided view
+    arr = make_c_contiguous(arr)
+
     if has_funi and not return_intersection:
         return (
             *funi.unique_rows(arr, tolerance, True, "l"),
@@ -228,26 +300,55 @@ def close_rows(
     )
 
 
-def bounds(arr):
+def bounds(arr, soa=False, dtype=None):
     """Return bounds.
 
     Parameters
     -----------
     arr: (n, d) array-like
+    soa: bool
+      Default is False. If True, arr is expected to be (d, n) structure of
+      arrays. Then, each axis is reduced along its contiguous row.
+    dtype: type or str
+      (Optional) dtype of bounds. Default is arr's dtype. For example,
+      "float64" for float32 arr.
 
     Returns
     --------
     bounds: (2, d) np.ndarray
     """
-    return np.vstack(
-        (
-            np.min(arr, axis=0).ravel(),
-            np.max(arr, axis=0).ravel(),
+    arr = np.asanyarray(arr)
+    if (
+        settings.NUMBA_ACCEL
+        and has_numba
+        and arr.ndim == 2
+        and arr.size > 0
+        # types supported by the kernel. for example, no float16
+        and arr.dtype.kind in "fiu"
+        and arr.dtype.itemsize >= 4
+    ):
+        # single pass over arr
+        kernels = _numba_kernels()
+        b = kernels.bounds(
+            np.asarray(arr), soa, kernels.numba.get_num_threads()
         )
-    )
 
+    else:
+        axis = 1 if soa else 0
+        b = np.vstack(
+            (
+                np.min(arr, axis=axis).ravel(),
+                np.max(arr, axis=axis).ravel(),
+            )
+        )
+
+    if dtype is not None:
+        return b.astype(dtype, copy=False)
+
+    return b
 
-def bounds_diagonal(arr):
+
+def bounds_diagonal(arr, dtype=None):
     """Returns diagonal vector of the bounds.
 
     bounds[1] - bounds[0]
@@ -255,12 +356,14 @@ def bounds_diagonal(arr):
     Parameters
     -----------
     arr: (n, d) array-like
+    dtype: type or str
+      (Optional) dtype used for the subtraction. Default is arr's dtype.
 
     Returns
     --------
     bounds_diagonal: (n,) np.ndarray
     """
-    b = bounds(arr)
+    b = bounds(arr, dtype=dtype)
     return b[1] - b[0]
 
 
@@ -292,6 +395,17 @@ def bounds_mean(arr):
     return np.mean(bounds(arr), axis=0)
 
 
+def _check_ranges(ranges, n_columns):
+    """Raises ValueError if ranges can't be applied to n_columns."""
+    if len(ranges) > n_columns:
+        raise ValueError(
+            f"{len(ranges)} ranges given for array with {n_columns} columns"
+        )
+
+    if all(r is None for r in ranges):
+        raise ValueError("at least one range should not be None")
+
+
 def select_with_ranges(arr, ranges):
     """Select array with ranges of each column. Always parsed as:
 
@@ -305,7 +419,17 @@ def select_with_ranges(arr, ranges):
     Returns
     --------
     ids: (n,) np.ndarray
+
+    Raises
+    -------
+    ValueError:
+       If more ranges than columns are given, or all the ranges are None.
     """
+    if settings.NUMBA_ACCEL and has_numba:
+        return select_with_ranges_fused(arr, ranges)
+
+    _check_ranges(ranges, np.shape(arr)[1])
+
     masks = []
     for i, r in enumerate(ranges):
         if r is None:
@@ -332,6 +456,50 @@ def select_with_ranges(arr, ranges):
     return np.arange(arr.shape[0])[mask]
 
 
+def select_with_ranges_fused(arr, ranges, soa=False):
+    """Same as select_with_ranges, but checks all the ranges in a single
+    pass over the rows using numba, instead of creating a mask per range.
+    Falls back to select_with_ranges, if numba is not available.
+
+    Parameters
+    -----------
+    arr: (n, d) array-like
+    ranges: (d, 2) array-like
+      Takes None.
+    soa: bool
+      Default is False. If True, arr is expected to be (d, n) structure of
+      arrays.
+
+    Returns
+    --------
+    ids: (n,) np.ndarray
+
+    Raises
+    -------
+    ValueError:
+       If more ranges than columns are given, or all the ranges are None.
+    """
+    if not has_numba:
+        return select_with_ranges(np.asanyarray(arr).T if soa else arr, ranges)
+
+    arr = np.asarray(arr)
+    _check_ranges(ranges, arr.shape[0] if soa else arr.shape[1])
+
+    lower = np.zeros(len(ranges), dtype=np.float64)
+    upper = np.zeros(len(ranges), dtype=np.float64)
+    active = np.zeros(len(ranges), dtype=bool)
+    for i, r in enumerate(ranges):
+        if r is None:
+            continue
+
+        lower[i], upper[i] = r
+        active[i] = True
+
+    mask = _numba_kernels().select_with_ranges(arr, lower, upper, active, soa)
+
+    return np.flatnonzero(mask)
+
+
 def rotation_matrix(rotation, degree=True):
     """Compute rotation matrix. Works for both 2D and 3D point sets. In 2D, it
     can rotate along the (virtual) z-axis. In 3D, it can rotate along [x, y,
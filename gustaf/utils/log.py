@@ -68,7 +68,9 @@ def debug(*log):
     None
     """
     logger = logging.getLogger("gustaf")
-    logger.debug(" ".join(map(str, log)))
+    # skip joining, if it won't be logged anyways
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(" ".join(map(str, log)))
 
 
 def info(*log):
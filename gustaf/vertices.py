@@ -93,6 +93,7 @@ class Vertices(GustafBase):
     __slots__ = (
         "_vertices",
         "_const_vertices",
+        "_const_vertices_valid",
         "_computed",
         "_show_options",
         "_vertex_data",
@@ -101,6 +102,9 @@ class Vertices(GustafBase):
     # define frequently used types as dunder variable
     __show_option__ = VerticesShowOption
 
+    # precision loss in vertices setter is only warned once
+    _warned_precision_loss = False
+
     def __init__(
         self,
         vertices=None,
@@ -156,18 +160,40 @@ class Vertices(GustafBase):
         """
         self._logd("setting vertices")
 
-        # we try not to make copy.
-        self._vertices = helpers.data.make_tracked_array(
-            vs, settings.FLOAT_DTYPE, copy=False
-        )
+        if (
+            not Vertices._warned_precision_loss
+            and isinstance(vs, np.ndarray)
+            and vs.dtype.kind == "f"
+            and vs.dtype.itemsize > np.dtype(settings.FLOAT_DTYPE).itemsize
+        ):
+            self._logw(
+                f"Given vertices ({vs.dtype}) will be stored as "
+                f"settings.FLOAT_DTYPE ({settings.FLOAT_DTYPE}). Consider "
+                f"settings.TOLERANCE ({settings.TOLERANCE}) accordingly. "
+                "This is only warned once."
+            )
+            Vertices._warned_precision_loss = True
+
+        # we try not to make copy. if this is our own tracked array, we can
+        # take it as it is. mark modified, as this is a new set. other
+        # tracked arrays are wrapped, so that modified flags aren't shared.
+        if (
+            isinstance(vs, helpers.data.TrackedArray)
+            and vs is getattr(self, "_vertices", None)
+            and vs.dtype == settings.FLOAT_DTYPE
+        ):
+            self._vertices._modified = True
+        else:
+            self._vertices = helpers.data.make_tracked_array(
+                vs, settings.FLOAT_DTYPE, copy=False
+            )
 
         # shape check
-        if self._vertices.size > 0:
+        if self._vertices.ndim != 2 and self._vertices.size > 0:
             utils.arr.is_shape(self._vertices, (-1, -1), strict=True)
 
-        # exact same, but not tracked.
-        self._const_vertices = self._vertices.view()
-        self._const_vertices.flags.writeable = False
+        # non-writeable view will be created on next const_vertices call
+        self._const_vertices_valid = False
 
         # at each setting, validate vertex_data
         # --> by len mismatch, will clear data
@@ -188,8 +214,31 @@ class Vertices(GustafBase):
         None
         """
         self._logd("returning const_vertices")
+        if not self._const_vertices_valid:
+            # exact same, but not tracked.
+            # TrackedArray.view() sets writeable flag
+            self._const_vertices = self._vertices.view()
+            self._const_vertices_valid = True
+
         return self._const_vertices
 
+    @helpers.data.ComputedMeshData.depends_on(["vertices"], make_property=True)
+    def const_vertices_soa(self):
+        """Returns non-mutable, structure of arrays (SoA) layout of vertices.
+        Each row holds one axis contiguously, which suits per-axis
+        traversals. Computed on request and kept until vertices change.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        const_vertices_soa: (d, n) np.ndarray
+        """
+        self._logd("computing const_vertices_soa")
+        return np.ascontiguousarray(self.const_vertices.T)
+
     @property
     def vertex_data(self):
         """
@@ -243,7 +292,8 @@ class Vertices(GustafBase):
     @helpers.data.ComputedMeshData.depends_on(["vertices"])
     def unique_vertices(self, tolerance=None, **kwargs):
         """Returns a namedtuple that holds unique vertices info. Unique here
-        means "close-enough-within-tolerance".
+        means "close-enough-within-tolerance". Set `settings.NUMBA_ACCEL` to
+        use numba accelerated search.
 
         Parameters
         -----------
@@ -317,7 +367,8 @@ class Vertices(GustafBase):
         bounds_diagonal_norm: float
         """
         self._logd("computing bounds_diagonal_norm")
-        return float(sum(self.bounds_diagonal() ** 2) ** 0.5)
+        diagonal = self.bounds_diagonal()
+        return float(np.sqrt(diagonal @ diagonal))
 
     def update_vertices(self, mask, inverse=None):
         """Update vertices with a mask. In other words, keeps only masked
@@ -333,7 +384,9 @@ class Vertices(GustafBase):
         --------
         updated_self: type(self)
         """
-        vertices = self.const_vertices.copy()
+        # no copy needed. masking below creates a new array. gather from a
+        # plain ndarray, so that the result does not inherit const-ness.
+        vertices = self.const_vertices.view(np.ndarray)
 
         # make mask numpy array
         mask = np.asarray(mask)
@@ -341,41 +394,62 @@ class Vertices(GustafBase):
         if (mask.dtype.name == "bool" and mask.all()) or len(mask) == 0:
             return self
 
+        if mask.dtype.kind == "b" and len(mask) != len(vertices):
+            raise IndexError(
+                f"boolean mask of length {len(mask)} given for "
+                f"{len(vertices)} vertices"
+            )
+
         # create inverse mask if not passed
         check_neg = False
+        check_mask = False
         if inverse is None and self.kind != "vertex":
-            inverse = np.full(len(vertices), -11, dtype=settings.INT_DTYPE)
-            check_neg = True
             if mask.dtype.kind == "b":
-                inverse[mask] = np.arange(mask.sum())
+                # running count is the new id of kept vertices. elements
+                # referencing removed vertices are filtered using the mask,
+                # so no sentinel values are needed here.
+                inverse = np.cumsum(mask, dtype=settings.INT_DTYPE)
+                inverse -= 1
+                check_mask = True
             elif mask.dtype.kind == "i":
+                inverse = np.full(len(vertices), -1, dtype=settings.INT_DTYPE)
                 inverse[mask] = np.arange(len(mask))
-            else:
-                inverse = None
+                check_neg = True
 
         # re-index elements from inverse
         # TODO: Here could be a good place to preserve BCs.
         elements = None
         if inverse is not None and self.kind != "vertex":
-            elements = self.const_elements.copy()
-            elements = inverse[elements.reshape(-1)].reshape(
-                (-1, elements.shape[1])
-            )
+            elements = self.const_elements
             # remove all the elements that's not part of inverse
+            if check_mask:
+                elements = elements[mask[elements].all(axis=1)]
+
+            elements = np.take(inverse, elements)
+
             if check_neg:
-                elem_mask = (elements > -1).all(axis=1)
-                elements = elements[elem_mask]
+                elements = elements[(elements >= 0).all(axis=1)]
+
+        # apply mask. bool mask is turned into ids once, so that vertices
+        # and all the vertex data can be gathered with the same ids.
+        if mask.dtype.kind == "b":
+            ids = np.flatnonzero(mask)
+            # mask length is checked above, so ids are always in range -
+            # skip bound checks
+            take_mode = "clip"
+        else:
+            ids = mask
+            take_mode = "raise"
 
-        # apply mask
-        vertices = vertices[mask]
+        vertices = vertices.take(ids, axis=0, mode=take_mode)
 
         def update_vertex_data(obj, m, vertex_data):
-            """apply mask to vertex data if there's any."""
+            """apply ids to vertex data if there's any."""
             new_data = helpers.data.VertexData(obj)
 
             for key, values in vertex_data.items():
                 # should work, since this is called after updating vertices
-                new_data[key] = values[m]
+                new_data[key] = values.take(m, axis=0, mode=take_mode)
 
             obj._vertex_data = new_data
 
@@ -390,7 +464,7 @@ class Vertices(GustafBase):
         if elements is not None:
             self.elements = elements
 
-        update_vertex_data(self, mask, v_data)
+        update_vertex_data(self, ids, v_data)
 
         return self
 
@@ -405,6 +479,11 @@ class Vertices(GustafBase):
         Returns
         --------
         ids: (n,) np.ndarray
+
+        Raises
+        -------
+        ValueError:
+           If more ranges than columns are given, or all the ranges are None.
         """
         return utils.arr.select_with_ranges(self.vertices, ranges)
 
@@ -476,7 +555,9 @@ class Vertices(GustafBase):
         return show.show(self, **kwargs)
 
     def copy(self):
-        """Returns deepcopy of self.
+        """Returns copy of self. Vertices, vertex_data and show_options
+        are copied explicitly. Computed data is not copied, as it is
+        computed again on request.
 
         Parameters
         -----------
@@ -486,13 +567,17 @@ class Vertices(GustafBase):
         --------
         self_copy: type(self)
         """
-        # all attributes are deepcopy-able
-        copied = copy.deepcopy(self)
+        copied = type(self)(vertices=self.const_vertices.copy())
+
+        # write directly to avoid setting show_options["data"]
+        for key, value in self.vertex_data._saved.items():
+            copied.vertex_data._saved[key] = helpers.data.make_tracked_array(
+                value, copy=True
+            )
 
-        # update helpee. otherwise keeps reference to self
-        copied._show_options._helpee = copied
-        copied._vertex_data._helpee = copied
-        copied._computed._helpee = copied
+        copied._show_options._options = copy.deepcopy(
+            self.show_options._options
+        )
 
         return copied
 
@@ -523,12 +608,15 @@ class Vertices(GustafBase):
         ):
             instances = instances[0]
 
-        vertices = []
         has_elem = cls.kind != "vertex"
-        if has_elem:
-            elements = []
 
-        # check if everything is "concatable".
+        # first pass - check if everything is "concatable" and count
+        to_concat = []
+        n_vertices = []
+        n_elements = []
+        # same instance may appear multiple times. clean it up only once.
+        # keeps reference to the instance, so that its id won't be reused.
+        cleaned = {}
         for ins in instances:
             if not is_concatable(ins):
                 raise TypeError(
@@ -536,31 +624,60 @@ class Vertices(GustafBase):
                     f"`{cls.__name__}`."
                 )
 
-            tmp_ins = ins.copy()
-
             # make sure each element index starts from 0 & end at len(vertices)
+            tmp_ins = ins
             if has_elem:
-                tmp_ins.remove_unreferenced_vertices()
+                if id(ins) not in cleaned:
+                    cleaned[id(ins)] = (
+                        ins,
+                        ins.copy().remove_unreferenced_vertices(),
+                    )
+                tmp_ins = cleaned[id(ins)][1]
+                n_elements.append(len(tmp_ins.const_elements))
+
+            n_vertices.append(len(tmp_ins.const_vertices))
+            to_concat.append(tmp_ins)
+
+        if len(to_concat) == 0:
+            raise ValueError("Can't concat. No instances given.")
+
+        # second pass - fill preallocated arrays, each with one call
+        vertices = np.concatenate(
+            [ins.const_vertices for ins in to_concat],
+            out=np.empty(
+                (sum(n_vertices), to_concat[0].const_vertices.shape[1]),
+                dtype=settings.FLOAT_DTYPE,
+            ),
+        )
 
-            vertices.append(tmp_ins.vertices)
+        if has_elem:
+            elements = np.concatenate(
+                [ins.const_elements for ins in to_concat],
+                out=np.empty(
+                    (sum(n_elements), to_concat[0].const_elements.shape[1]),
+                    dtype=settings.INT_DTYPE,
+                ),
+            )
 
-            if has_elem:
-                if len(elements) == 0:
-                    elements.append(tmp_ins.elements)
-                    e_offset = elements[-1].max() + 1
+            # vertex offsets of each instance
+            v_offsets = np.zeros(len(to_concat), dtype=settings.INT_DTYPE)
+            np.cumsum(n_vertices[:-1], out=v_offsets[1:])
 
-                else:
-                    elements.append(tmp_ins.elements + e_offset)
-                    e_offset = elements[-1].max() + 1
+            # same number of vertices and elements, for example, concat of
+            # the same mesh. offsets can be broadcasted per instance.
+            if len(set(n_vertices)) == 1 and len(set(n_elements)) == 1:
+                per_instance = elements.reshape(
+                    len(to_concat), n_elements[0], elements.shape[1]
+                )
+                per_instance += v_offsets.reshape(-1, 1, 1)
+            else:
+                elements += np.repeat(v_offsets, n_elements).reshape(-1, 1)
 
         if has_elem:
-            return cls(
-                vertices=np.vstack(vertices),
-                elements=np.vstack(elements),
-            )
+            return cls(vertices=vertices, elements=elements)
 
         else:
-            return Vertices(vertices=np.vstack(vertices))
+            return Vertices(vertices=vertices)
 
     def __add__(self, to_add):
         """Concat in form of +.
@@ -200,9 +200,9 @@ class Volumes(Faces):
                 ((-1, 4), (-1, 8)),
                 strict=True,
             )
-        # same, but non-writeable view of tracked array
+        # same, but non-writeable view of tracked array.
+        # TrackedArray.view() sets writeable flag
         self._const_volumes = self._volumes.view()
-        self._const_volumes.flags.writeable = False
 
     @property
     def const_volumes(self):
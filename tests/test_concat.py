@@ -45,3 +45,42 @@ def test_concat(grid, request):
         assert (
             np.tile(grid.elements, (n_grids, 1)) - concated.elements
         ).sum() == 0
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_concat_mixed(grid, np_rng, request):
+    """Test concat of instances with different number of vertices and
+    elements, including unreferenced vertices."""
+    grid = request.getfixturevalue(grid)
+
+    # extra vertices in front and at the back, which are not referenced
+    extra = np_rng.random((3, grid.vertices.shape[1]))
+    padded_vertices = np.vstack((extra[:2], grid.vertices, extra[2:]))
+    if grid.kind == "vertex":
+        padded = type(grid)(padded_vertices)
+    else:
+        padded = type(grid)(padded_vertices, grid.elements[::-1] + 2)
+
+    doubled = type(grid).concat(grid, grid)
+    instances = [grid, padded, doubled, grid]
+
+    concated = type(grid).concat(*instances)
+
+    if grid.kind == "vertex":
+        assert np.allclose(
+            np.vstack([ins.vertices for ins in instances]), concated.vertices
+        )
+        return
+
+    # reference: keep referenced vertices and offset re-indexed elements
+    vertices_ref = []
+    elements_ref = []
+    offset = 0
+    for ins in instances:
+        used, local = np.unique(ins.elements, return_inverse=True)
+        vertices_ref.append(ins.vertices[used])
+        elements_ref.append(local.reshape(ins.elements.shape) + offset)
+        offset += len(used)
+
+    assert np.allclose(np.vstack(vertices_ref), concated.vertices)
+    assert np.array_equal(np.vstack(elements_ref), concated.elements)
@@ -0,0 +1,160 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+
+
+@pytest.fixture
+def numba_accel(monkeypatch):
+    """Enables numba kernels for the test and restores the setting after."""
+    if not gus.utils.arr.has_numba:
+        pytest.skip("requires numba")
+
+    monkeypatch.setattr(gus.settings, "NUMBA_ACCEL", True)
+
+
+@pytest.mark.usefixtures("numba_accel")
+@pytest.mark.parametrize("dim", (2, 3))
+@pytest.mark.parametrize("tolerance", (1e-10, 5e-2))
+def test_close_rows_numba(dim, tolerance, np_rng):
+    """numba's spatial hashing should match with KDTree based search"""
+    scipy_spatial = pytest.importorskip("scipy.spatial")
+
+    random_rows = np_rng.random((200, dim))
+    arr = np.vstack((random_rows, random_rows, random_rows[:50]))
+
+    values, ids, inverse, intersection = gus.utils.arr.close_rows(
+        arr, tolerance, return_intersection=True
+    )
+
+    # reference
+    neighbors = scipy_spatial.cKDTree(arr).query_ball_point(
+        arr, tolerance, return_sorted=True
+    )
+    _, ids_ref, inverse_ref = np.unique(
+        [n[0] for n in neighbors], return_index=True, return_inverse=True
+    )
+
+    assert np.allclose(values, arr[ids_ref])
+    assert all(ids == ids_ref)
+    assert all(inverse == inverse_ref)
+    for n, n_ref in zip(intersection, neighbors):
+        assert all(n == n_ref)
+
+
+@pytest.mark.parametrize("soa", (False, True))
+def test_bounds_and_close_rows_soa(soa, vertices):
+    """bounds and close_rows should give the same results for SoA inputs"""
+    arr = vertices.const_vertices_soa if soa else vertices.const_vertices
+
+    assert np.allclose(vertices.bounds(), gus.utils.arr.bounds(arr, soa=soa))
+
+    ids = gus.utils.arr.close_rows(arr, soa=soa)[1]
+    assert all(ids == np.arange(len(vertices.vertices)))
+
+
+@pytest.mark.parametrize("soa", (False, True))
+@pytest.mark.parametrize(
+    "ranges",
+    (
+        [[0.2, 0.7], None, [0.1, 0.9]],
+        [[0.7, 0.2], [0.3, 0.5], [-1, 2]],
+        [None, [0.9, 0.1]],
+    ),
+)
+def test_select_with_ranges_fused(soa, ranges, np_rng):
+    """single pass selection should match mask based selection"""
+    arr = np_rng.random((300, 3))
+
+    ids_ref = gus.utils.arr.select_with_ranges(arr, ranges)
+    ids = gus.utils.arr.select_with_ranges_fused(
+        np.ascontiguousarray(arr.T) if soa else arr, ranges, soa=soa
+    )
+
+    assert all(ids == ids_ref)
+
+
+@pytest.mark.parametrize("soa", (False, True))
+@pytest.mark.parametrize(
+    "ranges",
+    (
+        [[0.2, 0.7], None, [0.1, 0.9], [0.1, 0.9]],
+        [None, None],
+    ),
+)
+def test_select_with_ranges_invalid(soa, ranges, np_rng):
+    """too many or only None ranges should raise in both paths"""
+    arr = np_rng.random((5, 3))
+
+    with pytest.raises(ValueError):
+        gus.utils.arr.select_with_ranges(arr, ranges)
+
+    with pytest.raises(ValueError):
+        gus.utils.arr.select_with_ranges_fused(
+            np.ascontiguousarray(arr.T) if soa else arr, ranges, soa=soa
+        )
+
+
+@pytest.mark.usefixtures("numba_accel")
+@pytest.mark.parametrize("soa", (False, True))
+def test_bounds_numba(soa, np_rng):
+    """single pass bounds should match numpy's min and max"""
+    arr = np_rng.random((1000, 3))
+    bounds_ref = np.vstack((arr.min(axis=0), arr.max(axis=0)))
+
+    bounds = gus.utils.arr.bounds(
+        np.ascontiguousarray(arr.T) if soa else arr, soa=soa
+    )
+
+    assert np.array_equal(bounds, bounds_ref)
+
+
+@pytest.mark.usefixtures("numba_accel")
+@pytest.mark.parametrize("soa", (False, True))
+@pytest.mark.parametrize("n", (1, 2, 9, 17, 59))
+@pytest.mark.parametrize("n_chunks", (2, 3, 8, 16))
+def test_bounds_numba_chunks(soa, n, n_chunks, np_rng):
+    """chunked reduction should match numpy for any number of rows"""
+    arr = np_rng.random((n, 3)) + 5.0
+    bounds_ref = np.vstack((arr.min(axis=0), arr.max(axis=0)))
+
+    bounds = gus.utils.arr._numba_kernels().bounds(
+        np.ascontiguousarray(arr.T) if soa else arr, soa, n_chunks
+    )
+
+    assert np.array_equal(bounds, bounds_ref)
+
+
+@pytest.mark.usefixtures("numba_accel")
+def test_bounds_numba_1d():
+    """1D arrays are not reduced by the kernel, but should still work"""
+    arr = np.arange(5.0)
+
+    assert np.array_equal(gus.utils.arr.bounds(arr), [[0.0], [4.0]])
+
+
+@pytest.mark.usefixtures("numba_accel")
+@pytest.mark.parametrize("dtype", ("float16", "float32", "int32", "int64"))
+def test_bounds_numba_dtypes(dtype, np_rng):
+    """all dtypes should work as with numpy, with or without the kernel"""
+    arr = (np_rng.random((20, 3)) * 100).astype(dtype)
+    bounds_ref = np.vstack((arr.min(axis=0), arr.max(axis=0)))
+
+    bounds = gus.utils.arr.bounds(arr)
+
+    assert bounds.dtype == bounds_ref.dtype
+    assert np.array_equal(bounds, bounds_ref)
+
+
+@pytest.mark.usefixtures("numba_accel")
+@pytest.mark.parametrize("n_chunks", (1, 3, 8))
+def test_bounds_numba_nan(n_chunks, np_rng):
+    """nan should propagate as in np.min and np.max"""
+    arr = np_rng.random((20, 3))
+    arr[7, 1] = np.nan
+    arr[0, 2] = np.nan
+    bounds_ref = np.vstack((arr.min(axis=0), arr.max(axis=0)))
+
+    bounds = gus.utils.arr._numba_kernels().bounds(arr, False, n_chunks)
+
+    assert np.array_equal(bounds, bounds_ref, equal_nan=True)
@@ -66,6 +66,17 @@ update_elements_params = (
 )
 
 
+def random_vertex_mask(n_vertices, mask_type, np_rng):
+    """Returns int or bool mask that keeps 3 random vertices."""
+    ids = np_rng.choice(np.arange(n_vertices), 3, replace=False)
+    if mask_type == "int":
+        return ids
+
+    mask = np.zeros(n_vertices, dtype=bool)
+    mask[ids] = True
+    return mask
+
+
 @pytest.mark.parametrize("grid", all_grids)
 def test_unique_vertices(grid, np_rng, request):
     """Test unique_vertices. requires scipy."""
@@ -246,3 +257,196 @@ def test_update_elements(grid, np_rng, request):
         test_grid.vertices[leftover_vertex_ids],
         grid.vertices[leftover_vertex_ids_ref],
     )
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_const_vertices(grid, np_rng, request):
+    """const_vertices should be a cached, non-writeable view of vertices"""
+    grid = request.getfixturevalue(grid)
+
+    const_vertices = grid.const_vertices
+    assert not const_vertices.flags.writeable
+    assert const_vertices is grid.const_vertices
+    assert np.shares_memory(const_vertices, grid.vertices)
+
+    # set new vertices. view should follow
+    new_vertices = np_rng.random(grid.vertices.shape)
+    grid.vertices = new_vertices
+    assert const_vertices is not grid.const_vertices
+    assert np.allclose(new_vertices, grid.const_vertices)
+
+    # setting itself should still invalidate computed values
+    grid.vertices[0] = [-1.0] * grid.vertices.shape[1]
+    bounds = grid.bounds()
+    grid.vertices = grid.vertices
+    assert grid.bounds() is not bounds
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_const_vertices_soa(grid, request):
+    """const_vertices_soa should be (d, n) and follow vertices changes"""
+    grid = request.getfixturevalue(grid)
+
+    soa = grid.const_vertices_soa
+    assert soa.flags.c_contiguous
+    assert not soa.flags.writeable
+    assert np.allclose(grid.vertices.T, soa)
+    assert soa is grid.const_vertices_soa
+
+    grid.vertices[0] = [-1.0] * grid.vertices.shape[1]
+    assert np.allclose(grid.vertices.T, grid.const_vertices_soa)
+
+
+@pytest.mark.parametrize("grid", all_grids[1:])
+def test_derived_vertices_tracked_separately(grid, request):
+    """meshes derived with to_* should not share tracked vertices"""
+    grid = request.getfixturevalue(grid)
+    to_lower = {
+        "edge": "to_vertices",
+        "face": "to_edges",
+        "volume": "to_faces",
+    }
+    derived = getattr(grid, to_lower[grid.kind])()
+    assert derived.vertices is not grid.vertices
+
+    grid.bounds()
+    derived.bounds()
+    grid.vertices[0] = [100.0] * grid.vertices.shape[1]
+    derived.bounds()
+
+    assert np.allclose(grid.bounds()[1], 100.0)
+
+
+@pytest.mark.parametrize("grid", all_grids)
+@pytest.mark.parametrize("mask_type", ("int", "bool"))
+def test_vertices_writeable_after_update(grid, mask_type, np_rng, request):
+    """updated vertices should stay writeable"""
+    grid = request.getfixturevalue(grid)
+    mask = random_vertex_mask(len(grid.vertices), mask_type, np_rng)
+
+    test_grid = grid.copy()
+    test_grid.update_vertices(mask)
+    test_grid.vertices[0] = 1.0
+    assert np.allclose(test_grid.vertices[0], 1.0)
+
+    # duplicate vertices, then merge
+    test_grid = grid.copy()
+    test_grid.vertices = np.vstack((grid.vertices, grid.vertices))
+    test_grid.merge_vertices()
+    test_grid.vertices[0] = 1.0
+    assert np.allclose(test_grid.vertices[0], 1.0)
+
+
+def test_float32_vertices(vertices_3d, monkeypatch, caplog):
+    """float32 vertices storage warns once about precision loss"""
+    monkeypatch.setattr(gus.settings, "FLOAT_DTYPE", "float32")
+    monkeypatch.setattr(gus.settings, "TOLERANCE", 1e-6)
+    monkeypatch.setattr(gus.Vertices, "_warned_precision_loss", False)
+
+    v = gus.Vertices(vertices_3d)
+    assert v.vertices.dtype == np.float32
+    assert len(caplog.records) == 1
+
+    gus.Vertices(vertices_3d)
+    assert len(caplog.records) == 1
+
+    # bounds can be requested in higher precision
+    bounds = gus.utils.arr.bounds(v.vertices, dtype="float64")
+    assert bounds.dtype == np.float64
+    assert np.allclose(bounds, v.bounds())
+
+    # merge still works with an adjusted tolerance
+    v.vertices = np.vstack((v.vertices, v.vertices + 1e-7))
+    assert len(v.merge_vertices().vertices) == len(vertices_3d)
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_mark_dirty(grid, request):
+    """untracked writes are picked up after mark_dirty()"""
+    grid = request.getfixturevalue(grid)
+
+    bounds = grid.bounds()
+    assert grid.bounds() is bounds
+
+    # write that bypasses tracked array
+    np.multiply(grid.vertices, 2.0, out=np.asarray(grid.vertices))
+    grid.vertices.mark_dirty()
+
+    assert np.allclose(grid.bounds(), bounds * 2.0)
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_copy(grid, request):
+    """copy should not share any data with the original"""
+    grid = request.getfixturevalue(grid)
+    grid.vertex_data["coords"] = grid.vertices
+    grid.show_options["c"] = "red"
+
+    copied = grid.copy()
+    assert type(copied) is type(grid)
+    assert not np.shares_memory(copied.vertices, grid.vertices)
+    assert np.allclose(copied.vertices, grid.vertices)
+    assert not np.shares_memory(
+        copied.vertex_data["coords"], grid.vertex_data["coords"]
+    )
+    assert np.allclose(copied.vertex_data["coords"], grid.vertices)
+    assert copied.show_options["c"] == "red"
+    assert copied.show_options["data"] == "coords"
+    assert copied.vertex_data._helpee is copied
+    assert copied.show_options._helpee is copied
+
+    if grid.kind != "vertex":
+        assert not np.shares_memory(copied.elements, grid.elements)
+        assert np.array_equal(copied.elements, grid.elements)
+
+    # modifying copy keeps original
+    copied.vertices[:] = -1.0
+    assert not np.allclose(grid.vertices, -1.0)
+    assert np.allclose(copied.bounds(), -1.0)
+
+
+@pytest.mark.parametrize(
+    "mesh_type, n_vertices",
+    ((gus.Edges, 0), (gus.Edges, 4), (gus.Faces, 3), (gus.Volumes, 4)),
+)
+def test_copy_without_elements(mesh_type, n_vertices, np_rng):
+    """meshes without elements can be copied"""
+    mesh = (
+        mesh_type(np_rng.random((n_vertices, 3)))
+        if n_vertices
+        else mesh_type()
+    )
+
+    copied = mesh.copy()
+    assert type(copied) is mesh_type
+    assert np.allclose(copied.vertices, mesh.vertices)
+    assert not hasattr(copied, "_" + mesh_type.__qualname__.lower())
+
+
+@pytest.mark.parametrize("grid", all_grids)
+@pytest.mark.parametrize("mask_type", ("int", "bool"))
+def test_update_vertices_vertex_data(grid, mask_type, np_rng, request):
+    """vertex_data should be masked together with vertices"""
+    grid = request.getfixturevalue(grid)
+    n_vertices = len(grid.vertices)
+    grid.vertex_data["ids"] = np.arange(n_vertices)
+    grid.vertex_data["coords"] = grid.vertices.copy()
+    mask = random_vertex_mask(n_vertices, mask_type, np_rng)
+
+    grid.update_vertices(mask)
+
+    assert all(grid.vertex_data["ids"].ravel() == np.arange(n_vertices)[mask])
+    assert np.allclose(grid.vertex_data["coords"], grid.vertices)
+
+
+@pytest.mark.parametrize("grid", all_grids)
+def test_update_vertices_mask_length(grid, request):
+    """bool masks of wrong length should raise, instead of clipping"""
+    grid = request.getfixturevalue(grid)
+    n_vertices = len(grid.vertices)
+
+    for n_mask in (n_vertices - 1, n_vertices + 1):
+        mask = np.zeros(n_mask, dtype=bool)
+        mask[:2] = True
+        with pytest.raises(IndexError):
+            grid.copy().update_vertices(mask)